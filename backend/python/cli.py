@@ -1,14 +1,94 @@
 import click
-import json
+import hashlib
+import os
+import pickle
 from pathlib import Path
 from typing import List, Dict, Any
 import logging
 from backend.python.workflow.engine import WorkflowEngine
 
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        # Workflow results are keyed by int task ids, which orjson rejects
+        # without OPT_NON_STR_KEYS (stdlib json coerces them silently)
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:  # Fall back to stdlib json when orjson is unavailable
+    import json
+
+    def _json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+try:
+    import ijson
+except ImportError:  # Streaming parse is optional; large files fall back to one-shot parsing
+    ijson = None
+
+# Above this size, parse incrementally so validation can short-circuit on the
+# first malformed task instead of tokenizing the whole file up front
+_STREAM_PARSE_THRESHOLD = 8 * 1024 * 1024  # 8 MiB
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def _load_tasks(tasks_path: Path) -> List[Dict[str, Any]]:
+    """Load and validate tasks from a JSON file, caching the parsed result in a sidecar file.
+
+    The cache is keyed by the file's mtime and SHA-256 hash, so repeated CLI runs on an
+    unchanged tasks file skip JSON parsing and per-task validation entirely.
+    """
+    raw = tasks_path.read_bytes()
+    file_hash = hashlib.sha256(raw).hexdigest()
+    mtime_ns = tasks_path.stat().st_mtime_ns
+    cache_path = tasks_path.with_suffix(tasks_path.suffix + '.cache.pkl')
+
+    # Warm path: reuse previously parsed and validated tasks
+    if cache_path.exists():
+        try:
+            with cache_path.open('rb') as f:
+                cached_hash, cached_mtime, tasks = pickle.load(f)
+            if cached_hash == file_hash and cached_mtime == mtime_ns:
+                logger.info(f"Loaded {len(tasks)} tasks from cache for {tasks_path}")
+                return tasks
+        except (pickle.PickleError, EOFError, ValueError) as e:
+            logger.warning(f"Ignoring invalid tasks cache {cache_path}: {str(e)}")
+
+    # Cold path: parse, validate, and refresh the cache
+    if ijson is not None and len(raw) > _STREAM_PARSE_THRESHOLD:
+        import io
+        # ijson.items yields nothing for a non-array document, which would
+        # silently become an empty task list; reject it up front instead
+        if raw.lstrip()[:1] != b'[':
+            raise ValueError("Tasks must be a list of dictionaries with 'type' and 'config' keys")
+        tasks = []
+        for task in ijson.items(io.BytesIO(raw), 'item', use_float=True):
+            if not isinstance(task, dict) or 'type' not in task or 'config' not in task:
+                raise ValueError("Tasks must be a list of dictionaries with 'type' and 'config' keys")
+            tasks.append(task)
+    else:
+        tasks = _json_loads(raw)
+        if not isinstance(tasks, list) or not all(isinstance(t, dict) and 'type' in t and 'config' in t for t in tasks):
+            raise ValueError("Tasks must be a list of dictionaries with 'type' and 'config' keys")
+
+    try:
+        tmp_path = cache_path.with_suffix(cache_path.suffix + '.tmp')
+        with tmp_path.open('wb') as f:
+            pickle.dump((file_hash, mtime_ns, tasks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)  # Atomic swap so readers never see a partial cache
+    except OSError as e:
+        logger.warning(f"Failed to write tasks cache {cache_path}: {str(e)}")
+
+    return tasks
+
 @click.group()
 def cli():
     """QuantumFlow Toolkit CLI: Manage hybrid quantum-classical workflows."""
@@ -20,14 +100,9 @@ def cli():
 def create_workflow(name: str, tasks_file: str):
     """Define a new hybrid workflow and save it to the database."""
     try:
-        # Load tasks from JSON file
+        # Load tasks from JSON file (cached across runs on the same file)
         tasks_path = Path(tasks_file)
-        with tasks_path.open('r') as f:
-            tasks = json.load(f)
-        
-        # Validate tasks
-        if not isinstance(tasks, list) or not all(isinstance(t, dict) and 'type' in t and 'config' in t for t in tasks):
-            raise ValueError("Tasks must be a list of dictionaries with 'type' and 'config' keys")
+        tasks = _load_tasks(tasks_path)
 
         # Initialize workflow engine
         engine = WorkflowEngine()
@@ -56,7 +131,7 @@ def run_workflow(id: int):
             raise ValueError(f"Failed to execute workflow ID {id}")
 
         click.echo(f"Workflow {id} executed successfully:")
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_json_dumps(result, indent=True))
     except Exception as e:
         logger.error(f"Error running workflow {id}: {str(e)}")
         click.echo(f"Error: {str(e)}", err=True)
@@ -75,7 +150,7 @@ def monitor_workflow(id: int):
             raise ValueError(f"Workflow ID {id} not found")
 
         click.echo(f"Workflow Status for ID {id}:")
-        click.echo(json.dumps(status, indent=2))
+        click.echo(_json_dumps(status, indent=True))
     except Exception as e:
         logger.error(f"Error monitoring workflow {id}: {str(e)}")
         click.echo(f"Error: {str(e)}", err=True)
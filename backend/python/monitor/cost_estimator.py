@@ -1,11 +1,49 @@
 import logging
-from typing import Dict, Any, Optional
-import json
+from functools import lru_cache
+from typing import List, Tuple, Dict, Any, Optional
+import numpy as np
+
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # Fall back to stdlib json when orjson is unavailable
+    import json
+
+    def _json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cost_kernel(shots, depth, cps, cpd, idx, out):  # pragma: no cover - compiled
+        for i in prange(shots.size):
+            j = idx[i]
+            out[i] = shots[i] * cps[j] + depth[i] * cpd[j]
+except ImportError:  # Numba is optional; huge sweeps just use the NumPy path
+    _cost_kernel = None
+
+# Below this many tasks the NumPy expression wins; above it the fused Numba
+# kernel avoids the temporary arrays NumPy allocates per term
+_NUMBA_THRESHOLD = 100_000
+
+@lru_cache(maxsize=4096)
+def _task_cost(prices: Tuple[float, float], shots: int, depth: int) -> float:
+    """Cost kernel memoized on (pricing pair, shots, depth); repeated task shapes hit the cache."""
+    return shots * prices[0] + depth * prices[1]
+
 class CostEstimator:
     """Estimates resource costs for quantum tasks based on shots and circuit depth."""
     
@@ -25,6 +63,18 @@ class CostEstimator:
                 'cloud': {'cost_per_shot': 0.009, 'cost_per_depth': 0.045}
             }
         }
+        # Flat (backend, backend_type) -> (cost_per_shot, cost_per_depth) table: one hash
+        # lookup instead of three nested dict probes per task
+        self._prices = {
+            (backend, backend_type): (rates['cost_per_shot'], rates['cost_per_depth'])
+            for backend, types in self.pricing_models.items()
+            for backend_type, rates in types.items()
+        }
+        # Columnar pricing arrays for the vectorized and Numba cost kernels
+        self._price_index = {key: i for i, key in enumerate(self._prices)}
+        rates = np.array(list(self._prices.values()), dtype=np.float64)
+        self._cost_per_shot = np.ascontiguousarray(rates[:, 0])
+        self._cost_per_depth = np.ascontiguousarray(rates[:, 1])
         logger.info("Initialized CostEstimator with pricing models")
 
     def estimate_task_cost(self, task_config: Dict[str, Any], backend: str, backend_type: str = 'simulator') -> Optional[float]:
@@ -38,16 +88,16 @@ class CostEstimator:
             shots = config.get('shots', 100)
             depth = config.get('depth', 10)
 
-            # Validate backend and backend type
-            if backend not in self.pricing_models:
-                raise ValueError(f"Unsupported backend: {backend}")
-            if backend_type not in self.pricing_models[backend]:
+            # Validate backend and backend type against the flat pricing table
+            prices = self._prices.get((backend, backend_type))
+            if prices is None:
+                if backend not in self.pricing_models:
+                    raise ValueError(f"Unsupported backend: {backend}")
                 raise ValueError(f"Unsupported backend type: {backend_type} for {backend}")
 
-            # Calculate cost
-            pricing = self.pricing_models[backend][backend_type]
-            cost = (shots * pricing['cost_per_shot']) + (depth * pricing['cost_per_depth'])
-            
+            # Calculate cost via the memoized kernel; identical task shapes are O(1) after warmup
+            cost = _task_cost(prices, shots, depth)
+
             logger.info(f"Estimated cost for task on {backend} ({backend_type}): ${cost:.4f}")
             return cost
         except Exception as e:
@@ -57,25 +107,44 @@ class CostEstimator:
     def estimate_workflow_cost(self, tasks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Estimate total cost for a workflow's tasks."""
         try:
-            total_cost = 0.0
-            cost_breakdown = []
-            
+            # Gather shots/depth/pricing rows as structure-of-arrays so the cost math
+            # runs as a single NumPy pass instead of per-task Python arithmetic
+            count = len(tasks)
+            shots = np.empty(count, dtype=np.int64)
+            depth = np.empty(count, dtype=np.int64)
+            idx = np.empty(count, dtype=np.int64)
+            backends = []
+
             for task_id, task in enumerate(tasks):
-                backend = task.get('config', {}).get('backend', 'cirq')
-                backend_type = task.get('config', {}).get('backend_type', 'simulator')
-                cost = self.estimate_task_cost(task, backend, backend_type)
-                
-                if cost is None:
+                config = task.get('config', {})
+                backend = config.get('backend', 'cirq')
+                backend_type = config.get('backend_type', 'simulator')
+                price_idx = self._price_index.get((backend, backend_type))
+                if task.get('type') != 'quantum' or 'config' not in task or price_idx is None:
                     raise ValueError(f"Failed to estimate cost for task {task_id}")
-                
-                cost_breakdown.append({
+
+                shots[task_id] = config.get('shots', 100)
+                depth[task_id] = config.get('depth', 10)
+                idx[task_id] = price_idx
+                backends.append((backend, backend_type))
+
+            if _cost_kernel is not None and count >= _NUMBA_THRESHOLD:
+                costs = np.empty(count, dtype=np.float64)
+                _cost_kernel(shots, depth, self._cost_per_shot, self._cost_per_depth, idx, costs)
+            else:
+                costs = shots * self._cost_per_shot[idx] + depth * self._cost_per_depth[idx]
+            total_cost = float(costs.sum())
+
+            cost_breakdown = [
+                {
                     'task_id': task_id,
                     'backend': backend,
                     'backend_type': backend_type,
-                    'cost': cost
-                })
-                total_cost += cost
-            
+                    'cost': float(cost)
+                }
+                for task_id, ((backend, backend_type), cost) in enumerate(zip(backends, costs))
+            ]
+
             logger.info(f"Estimated total workflow cost: ${total_cost:.4f}")
             return {'total_cost': total_cost, 'breakdown': cost_breakdown}
         except Exception as e:
@@ -104,23 +173,52 @@ class CostEstimator:
                     'estimated_cost': cost
                 })
             
+            # Greedy value/cost pre-selection: keep the best-ratio prefix that fits the
+            # budget so the Rust solve only sees tasks that can actually be scheduled
+            costs = np.fromiter((tc['estimated_cost'] for tc in task_configs), dtype=np.float64, count=len(task_configs))
+            values = np.ones_like(costs)  # Uniform value until tasks declare priorities
+            order = np.argsort(-(values / np.maximum(costs, 1e-12)), kind='stable')
+            selected = order[np.cumsum(costs[order]) <= max_budget]
+            if len(selected) < len(task_configs):
+                logger.info(f"Budget pre-selection kept {len(selected)} of {len(task_configs)} tasks")
+            task_configs = [task_configs[i] for i in sorted(selected)]
+
+            # The native scheduler indexes its graph arrays by task id, so the
+            # selection must be re-numbered 0..k-1; original ids are restored on
+            # the returned schedule below
+            original_ids = [tc['id'] for tc in task_configs]
+            for k, tc in enumerate(task_configs):
+                tc['id'] = k
+
             # Initialize scheduler
             scheduler = WorkflowScheduler()
-            
-            # Call Rust scheduler with cost constraints
+
+            # Call Rust scheduler with cost constraints; prefer the native PyO3 entry
+            # point, which passes task dicts directly with no JSON round-trip
             try:
-                prioritized_tasks = scheduler.rust_scheduler.schedule_tasks(
-                    json.dumps(task_configs),
-                    max_latency=600.0,  # 10 minutes
-                    max_budget=max_budget
-                )
-                prioritized_tasks = json.loads(prioritized_tasks)
+                if hasattr(scheduler.rust_scheduler, 'schedule_tasks_native'):
+                    prioritized_tasks = scheduler.rust_scheduler.schedule_tasks_native(
+                        task_configs,
+                        max_latency=600.0,  # 10 minutes
+                        max_budget=max_budget
+                    )
+                else:
+                    prioritized_tasks = scheduler.rust_scheduler.schedule_tasks(
+                        _json_dumps(task_configs),
+                        max_latency=600.0,
+                        max_budget=max_budget
+                    )
+                    prioritized_tasks = _json_loads(prioritized_tasks)
             except Exception as e:
                 logger.error(f"Rust scheduler error during optimization: {str(e)}")
                 return None
             finally:
                 scheduler.close()
-            
+
+            # Map the compacted ids back to the caller's task indices
+            for task in prioritized_tasks:
+                task['id'] = original_ids[task['id']]
+
             # Validate total cost
             total_cost = sum(task['estimated_cost'] for task in prioritized_tasks)
             if total_cost > max_budget:
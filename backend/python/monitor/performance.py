@@ -1,18 +1,21 @@
+import aiosqlite
+import asyncio
 import sqlite3
+import threading
 import time
 import logging
-from typing import Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional
 from pathlib import Path
-import json
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# FastAPI app for performance metrics API
-app = FastAPI()
+# FastAPI app for performance metrics API; orjson handles response serialization
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Pydantic model for API response
 class MetricsResponse(BaseModel):
@@ -25,16 +28,28 @@ class MetricsResponse(BaseModel):
 class PerformanceMonitor:
     """Tracks and stores performance metrics for hybrid workflows."""
     
+    # Pending rows buffered in memory before one batched commit
+    _FLUSH_THRESHOLD = 256
+
     def __init__(self, db_path: str = 'workflows.db'):
         self.db_path = Path(db_path)
         self.conn = None
+        self._aconn = None
+        self._pending: List[Tuple[int, int, float, Optional[int], Optional[int]]] = []
         self._init_db()
     
     def _init_db(self) -> None:
         """Initialize SQLite table for performance metrics."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.row_factory = sqlite3.Row
             cursor = self.conn.cursor()
+            # WAL avoids writer/reader blocking and synchronous=NORMAL drops the
+            # per-commit fsync, which dominates insert latency on this workload
+            cursor.execute('PRAGMA journal_mode=WAL')
+            cursor.execute('PRAGMA synchronous=NORMAL')
+            cursor.execute('PRAGMA temp_store=MEMORY')
+            cursor.execute('PRAGMA mmap_size=268435456')
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS performance_metrics (
                     workflow_id INTEGER,
@@ -46,6 +61,13 @@ class PerformanceMonitor:
                     PRIMARY KEY (workflow_id, task_id)
                 )
             ''')
+            # Covering index so workflow-scoped reads are index-only scans with no
+            # per-row table lookup; ANALYZE lets the planner pick it
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_perf_cover
+                ON performance_metrics(workflow_id, task_id, runtime, circuit_depth, shots, timestamp)
+            ''')
+            cursor.execute('ANALYZE')
             self.conn.commit()
             logger.info(f"Initialized performance_metrics table in {self.db_path}")
         except sqlite3.Error as e:
@@ -64,21 +86,63 @@ class PerformanceMonitor:
             shots = config.get('shots', 0) if task_type == 'quantum' else None
             runtime = time.time() - start_time
 
-            # Store metrics
+            # Hand the row to the background writer when one is running so callers
+            # never block on a disk commit; otherwise buffer for a batched flush.
+            # track_metrics runs from worker threads, and asyncio.Queue is not
+            # thread-safe, so the enqueue is marshalled through the owning loop
+            row = (workflow_id, task_id, runtime, circuit_depth, shots)
+            queue, loop = _write_queue, _write_loop
+            if queue is not None and loop is not None:
+                try:
+                    loop.call_soon_threadsafe(queue.put_nowait, row)
+                except RuntimeError:  # Loop shut down between check and call
+                    self._pending.append(row)
+                    if len(self._pending) >= self._FLUSH_THRESHOLD:
+                        self.flush()
+            else:
+                self._pending.append(row)
+                if len(self._pending) >= self._FLUSH_THRESHOLD:
+                    self.flush()
+            logger.info(f"Tracked metrics for workflow {workflow_id}, task {task_id}: runtime={runtime:.2f}s")
+        except sqlite3.Error as e:
+            logger.error(f"Error tracking metrics for workflow {workflow_id}, task {task_id}: {str(e)}")
+            raise
+
+    def flush(self) -> None:
+        """Write buffered metrics rows in a single transaction."""
+        if not self._pending:
+            return
+        try:
             cursor = self.conn.cursor()
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT OR REPLACE INTO performance_metrics (workflow_id, task_id, runtime, circuit_depth, shots)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (workflow_id, task_id, runtime, circuit_depth, shots))
+            ''', self._pending)
             self.conn.commit()
-            logger.info(f"Tracked metrics for workflow {workflow_id}, task {task_id}: runtime={runtime:.2f}s")
+            logger.info(f"Flushed {len(self._pending)} buffered metric rows")
+            self._pending.clear()
         except sqlite3.Error as e:
-            logger.error(f"Error tracking metrics for workflow {workflow_id}, task {task_id}: {str(e)}")
+            logger.error(f"Error flushing buffered metrics: {str(e)}")
             raise
     
+    def track_metrics_batch(self, rows: List[Tuple[int, int, float, Optional[int], Optional[int]]]) -> None:
+        """Store a batch of (workflow_id, task_id, runtime, circuit_depth, shots) rows in one transaction."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany('''
+                INSERT OR REPLACE INTO performance_metrics (workflow_id, task_id, runtime, circuit_depth, shots)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+            self.conn.commit()
+            logger.info(f"Tracked metrics for {len(rows)} tasks in one batch")
+        except sqlite3.Error as e:
+            logger.error(f"Error tracking metrics batch: {str(e)}")
+            raise
+
     def get_metrics(self, workflow_id: int, task_id: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
         """Retrieve performance metrics for a workflow or specific task."""
         try:
+            self.flush()  # Make buffered rows visible to the read
             cursor = self.conn.cursor()
             if task_id is not None:
                 cursor.execute('''
@@ -93,17 +157,14 @@ class PerformanceMonitor:
                     WHERE workflow_id = ?
                 ''', (workflow_id,))
 
-            results = [
-                {
-                    'workflow_id': row[0],
-                    'task_id': row[1],
-                    'runtime': row[2],
-                    'circuit_depth': row[3],
-                    'shots': row[4],
-                    'timestamp': row[5]
-                }
-                for row in cursor.fetchall()
-            ]
+            # Stream in batches instead of materializing fetchall() at once;
+            # sqlite3.Row gives named columns without a hand-built dict per row
+            results = []
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                results.extend(dict(row) for row in rows)
             if not results:
                 raise ValueError(f"No metrics found for workflow {workflow_id}")
             logger.info(f"Retrieved metrics for workflow {workflow_id}")
@@ -112,39 +173,151 @@ class PerformanceMonitor:
             logger.error(f"Error retrieving metrics: {str(e)}")
             return None
     
+    async def connect_async(self) -> None:
+        """Open the aiosqlite connection used by the non-blocking API read path."""
+        if self._aconn is None:
+            self._aconn = await aiosqlite.connect(self.db_path)
+            self._aconn.row_factory = sqlite3.Row
+            logger.info(f"Opened async database connection to {self.db_path}")
+
+    async def get_metrics_async(self, workflow_id: int, task_id: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+        """Retrieve performance metrics without blocking the event loop."""
+        try:
+            self.flush()  # Make buffered rows visible to the read
+            await self.connect_async()
+            if task_id is not None:
+                cursor = await self._aconn.execute('''
+                    SELECT workflow_id, task_id, runtime, circuit_depth, shots, timestamp
+                    FROM performance_metrics
+                    WHERE workflow_id = ? AND task_id = ?
+                ''', (workflow_id, task_id))
+            else:
+                cursor = await self._aconn.execute('''
+                    SELECT workflow_id, task_id, runtime, circuit_depth, shots, timestamp
+                    FROM performance_metrics
+                    WHERE workflow_id = ?
+                ''', (workflow_id,))
+
+            results = []
+            while True:
+                rows = await cursor.fetchmany(1000)
+                if not rows:
+                    break
+                results.extend(dict(row) for row in rows)
+            if not results:
+                raise ValueError(f"No metrics found for workflow {workflow_id}")
+            logger.info(f"Retrieved metrics for workflow {workflow_id}")
+            return results
+        except (aiosqlite.Error, ValueError) as e:
+            logger.error(f"Error retrieving metrics: {str(e)}")
+            return None
+
+    async def close_async(self) -> None:
+        """Close the async database connection."""
+        try:
+            if self._aconn:
+                await self._aconn.close()
+                self._aconn = None
+                logger.info("Closed async database connection")
+        except aiosqlite.Error as e:
+            logger.error(f"Error closing async database connection: {str(e)}")
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Flush buffered metrics and close the database connection."""
         try:
             if self.conn:
+                self.flush()
                 self.conn.close()
                 logger.info("Closed database connection")
         except sqlite3.Error as e:
             logger.error(f"Error closing database connection: {str(e)}")
 
+# Shared monitor for API requests: opening a connection (and re-running CREATE TABLE)
+# per request serializes on disk syncs under concurrent load
+_monitor_lock = threading.Lock()
+_shared_monitor: Optional[PerformanceMonitor] = None
+
+def get_monitor() -> PerformanceMonitor:
+    """FastAPI dependency yielding a process-wide PerformanceMonitor."""
+    global _shared_monitor
+    if _shared_monitor is None:  # Fast path: skip the lock once initialized
+        with _monitor_lock:
+            if _shared_monitor is None:
+                _shared_monitor = PerformanceMonitor()
+    return _shared_monitor
+
+# Background metrics writer: requests enqueue rows, one task drains them in
+# batches so disk commits never sit on the request path. asyncio.Queue is not
+# thread-safe, so enqueues from worker threads must hop through the loop
+_write_queue: Optional['asyncio.Queue'] = None
+_write_loop: Optional['asyncio.AbstractEventLoop'] = None
+_writer_task: Optional['asyncio.Task'] = None
+_WRITER_BATCH_SIZE = 256
+_WRITER_BATCH_WINDOW = 0.1  # seconds
+
+async def _writer_loop() -> None:
+    monitor = get_monitor()
+    loop = asyncio.get_running_loop()
+    while True:
+        rows = [await _write_queue.get()]
+        deadline = loop.time() + _WRITER_BATCH_WINDOW
+        while len(rows) < _WRITER_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                rows.append(await asyncio.wait_for(_write_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        try:
+            monitor.track_metrics_batch(rows)
+        except sqlite3.Error:
+            logger.error(f"Background writer failed to store {len(rows)} rows")
+
 # FastAPI endpoints
-@app.get("/api/performance/{workflow_id}", response_model=List[MetricsResponse])
-async def get_workflow_metrics(workflow_id: int):
+@app.on_event("startup")
+async def open_async_db() -> None:
+    """Open the shared async connection and start the background writer."""
+    global _write_queue, _write_loop, _writer_task
+    await get_monitor().connect_async()
+    _write_queue = asyncio.Queue()
+    _write_loop = asyncio.get_running_loop()
+    _writer_task = asyncio.create_task(_writer_loop())
+
+@app.on_event("shutdown")
+async def close_async_db() -> None:
+    """Flush tail writes, stop the writer, and close the async connection."""
+    global _write_queue, _write_loop, _writer_task
+    _write_loop = None
+    if _writer_task is not None:
+        _writer_task.cancel()
+        _writer_task = None
+    if _write_queue is not None:
+        rows = []
+        while not _write_queue.empty():
+            rows.append(_write_queue.get_nowait())
+        _write_queue = None
+        if rows:
+            get_monitor().track_metrics_batch(rows)
+    await get_monitor().close_async()
+
+# Rows come straight from our own table, so model_construct skips per-field
+# validation that otherwise dominates CPU on these read-mostly endpoints
+@app.get("/api/performance/{workflow_id}")
+async def get_workflow_metrics(workflow_id: int, monitor: PerformanceMonitor = Depends(get_monitor)):
     """API endpoint to retrieve metrics for a workflow."""
-    monitor = PerformanceMonitor()
-    try:
-        metrics = monitor.get_metrics(workflow_id)
-        if metrics is None:
-            raise HTTPException(status_code=404, detail=f"No metrics found for workflow {workflow_id}")
-        return metrics
-    finally:
-        monitor.close()
-
-@app.get("/api/performance/{workflow_id}/{task_id}", response_model=MetricsResponse)
-async def get_task_metrics(workflow_id: int, task_id: int):
+    metrics = await monitor.get_metrics_async(workflow_id)
+    if metrics is None:
+        raise HTTPException(status_code=404, detail=f"No metrics found for workflow {workflow_id}")
+    return [MetricsResponse.model_construct(**row) for row in metrics]
+
+@app.get("/api/performance/{workflow_id}/{task_id}")
+async def get_task_metrics(workflow_id: int, task_id: int, monitor: PerformanceMonitor = Depends(get_monitor)):
     """API endpoint to retrieve metrics for a specific task."""
-    monitor = PerformanceMonitor()
-    try:
-        metrics = monitor.get_metrics(workflow_id, task_id)
-        if metrics is None or not metrics:
-            raise HTTPException(status_code=404, detail=f"No metrics found for workflow {workflow_id}, task {task_id}")
-        return metrics[0]
-    finally:
-        monitor.close()
+    metrics = await monitor.get_metrics_async(workflow_id, task_id)
+    if metrics is None or not metrics:
+        raise HTTPException(status_code=404, detail=f"No metrics found for workflow {workflow_id}, task {task_id}")
+    return MetricsResponse.model_construct(**metrics[0])
 
 if __name__ == "__main__":
     # Example usage
@@ -1,28 +1,69 @@
-import cirq
-import cirq_google
+import asyncio
+import importlib
 import os
 import logging
-from typing import Dict, Any, Optional
-from cirq import Circuit, NamedQubit, X, Simulator
-from google.cloud import quantum_v1alpha1 as quantum
-from google.oauth2 import service_account
-from google.api_core import exceptions
+from functools import lru_cache
+from typing import ClassVar, List, Dict, Any, Optional
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Heavy SDK modules resolved lazily (PEP 562) so importing this module — e.g. from
+# the CLI — doesn't pay for cirq and the Google cloud stack until a circuit runs
+_LAZY_MODULES = {
+    'cirq': 'cirq',
+    'cirq_google': 'cirq_google',
+    'quantum': 'google.cloud.quantum_v1alpha1',
+    'exceptions': 'google.api_core.exceptions',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=None)
+def _get_template(circuit_type: str) -> Any:
+    """Build the template circuit for a circuit type once per process."""
+    from cirq import Circuit, NamedQubit, X
+
+    if circuit_type == 'simple_x':
+        return Circuit([X(NamedQubit('q0'))])
+    raise ValueError(f"Unsupported circuit type: {circuit_type}")
+
+@lru_cache(maxsize=None)
+def _load_credentials(api_key_path: str) -> Any:
+    """Parse the service-account key file once per process."""
+    from google.oauth2 import service_account
+
+    return service_account.Credentials.from_service_account_file(api_key_path)
+
 class CirqBackend:
     """Integrates with Google's Cirq and qsim for executing quantum circuits."""
-    
+
+    # gRPC clients cached per key path so per-task instantiation reuses the channel
+    _client_cache: ClassVar[Dict[str, Any]] = {}
+
     def __init__(self, api_key_path: Optional[str] = None):
+        from cirq import Simulator
+
         self.api_key_path = api_key_path or os.getenv('CIRQ_API_KEY')
         self.simulator = Simulator()
         self.client = None
         if self.api_key_path:
+            if self.api_key_path in self._client_cache:
+                self.client = self._client_cache[self.api_key_path]
+                logger.info("Reusing cached Google Quantum Engine client")
+                return
             try:
-                credentials = service_account.Credentials.from_service_account_file(self.api_key_path)
+                from google.cloud import quantum_v1alpha1 as quantum
+
+                credentials = _load_credentials(self.api_key_path)
                 self.client = quantum.QuantumEngineServiceClient(credentials=credentials)
+                self._client_cache[self.api_key_path] = self.client
                 logger.info("Initialized CirqBackend with Google Quantum Engine client")
             except Exception as e:
                 logger.error(f"Failed to initialize Google Quantum Engine client: {str(e)}")
@@ -40,13 +81,8 @@ class CirqBackend:
             shots = config.get('shots', 100)
             backend = config.get('backend', 'simulator')
 
-            # Build example circuit (replace with actual circuit parsing in production)
-            qubit = NamedQubit('q0')
-            circuit = Circuit()
-            if circuit_type == 'simple_x':
-                circuit.append(X(qubit))
-            else:
-                raise ValueError(f"Unsupported circuit type: {circuit_type}")
+            # Clone the prebuilt template circuit (replace with actual circuit parsing in production)
+            circuit = _get_template(circuit_type).copy()
 
             # Execute based on backend
             if backend == 'simulator':
@@ -62,7 +98,18 @@ class CirqBackend:
             logger.error(f"Error executing circuit: {str(e)}")
             return None
     
-    def _run_simulator(self, circuit: Circuit, shots: int) -> Dict[str, int]:
+    async def execute_many_async(self, configs: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Execute several circuit configs concurrently.
+
+        Cloud submissions are network-bound round-trips, so overlapping them hides
+        latency up to provider rate limits. Each config runs in a worker thread and
+        results are returned in input order.
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.execute_cirq_circuit, config) for config in configs)
+        )
+
+    def _run_simulator(self, circuit: 'cirq.Circuit', shots: int) -> Dict[str, int]:
         """Run circuit on Cirq's simulator."""
         try:
             result = self.simulator.run(circuit, repetitions=shots)
@@ -72,9 +119,12 @@ class CirqBackend:
             logger.error(f"Simulator execution error: {str(e)}")
             raise
     
-    def _run_cloud(self, circuit: Circuit, shots: int, processor_id: str) -> Dict[str, Any]:
+    def _run_cloud(self, circuit: 'cirq.Circuit', shots: int, processor_id: str) -> Dict[str, Any]:
         """Run circuit on Google Quantum Engine cloud QPU."""
         try:
+            import cirq_google
+            from google.api_core import exceptions
+
             if not self.client:
                 raise ValueError("Google Quantum Engine client not initialized")
 
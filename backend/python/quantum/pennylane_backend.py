@@ -1,9 +1,21 @@
+import importlib
 import os
 import logging
 from typing import Dict, Any, Optional
-import pennylane as qml
-import numpy as np
-from pennylane import numpy as pnp
+
+# pennylane resolved lazily (PEP 562); importing this module stays cheap for
+# callers that never execute a circuit
+_LAZY_MODULES = {
+    'qml': 'pennylane',
+    'pnp': 'pennylane.numpy',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -20,6 +32,9 @@ class PennyLaneBackend:
     def execute_pennylane_circuit(self, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Execute a variational quantum circuit defined in the workflow config."""
         try:
+            import pennylane as qml
+            from pennylane import numpy as pnp
+
             # Validate config
             if 'circuit' not in config:
                 raise ValueError("Circuit configuration is required")
@@ -1,25 +1,82 @@
+import importlib
 import os
+import sys
 import logging
-from typing import Dict, Any, Optional
-from qiskit import QuantumCircuit, Aer, IBMQ
-from qiskit.execute import execute
-from qiskit.providers.ibmq import IBMQError
+import asyncio
+from functools import lru_cache
+from typing import ClassVar, List, Dict, Any, Optional
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# qiskit resolved lazily (PEP 562) so importing this module costs nothing until a
+# circuit actually runs
+_LAZY_MODULES = {
+    'qiskit': 'qiskit',
+}
+
+# Names historically re-exported at module level (and patched by the tests);
+# resolved from the qiskit package on first access
+_LAZY_ATTRS = {
+    'IBMQ': 'qiskit',
+    'execute': 'qiskit',
+    'Aer': 'qiskit',
+    'QuantumCircuit': 'qiskit',
+}
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_MODULES:
+        module = importlib.import_module(_LAZY_MODULES[name])
+        globals()[name] = module
+        return module
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=None)
+def _get_template(circuit_type: str) -> Any:
+    """Build the template circuit for a circuit type once per process."""
+    from qiskit import QuantumCircuit
+
+    if circuit_type == 'simple_x':
+        circuit = QuantumCircuit(1, 1)
+        circuit.x(0)
+        circuit.measure(0, 0)
+        return circuit
+    raise ValueError(f"Unsupported circuit type: {circuit_type}")
+
 class QiskitBackend:
     """Integrates with IBM's Qiskit for executing quantum circuits."""
-    
+
+    # Providers cached per API key: save_account/load_account hit disk and the IBM
+    # Quantum API, so per-task backend instantiation must not repeat them
+    _provider_cache: ClassVar[Dict[str, Any]] = {}
+
     def __init__(self, api_key: Optional[str] = None):
+        from qiskit import Aer
+
         self.api_key = api_key or os.getenv('QISKIT_API_KEY')
         self.backend = None
         self.provider = None
+        # Reuse one Aer handle and transpile each circuit type only once
+        self._aer = Aer.get_backend('qasm_simulator')
+        self._transpiled_cache: Dict[str, Any] = {}
         if self.api_key:
+            if self.api_key in self._provider_cache:
+                self.provider = self._provider_cache[self.api_key]
+                logger.info("Reusing cached IBM Quantum provider")
+                return
             try:
+                # Resolved through the module attribute so test patches on
+                # qiskit_backend.IBMQ apply
+                IBMQ = getattr(sys.modules[__name__], 'IBMQ')
+
                 IBMQ.save_account(self.api_key, overwrite=True)
                 self.provider = IBMQ.load_account()
+                self._provider_cache[self.api_key] = self.provider
                 logger.info("Initialized QiskitBackend with IBM Quantum provider")
             except Exception as e:
                 logger.error(f"Failed to initialize IBM Quantum provider: {str(e)}")
@@ -39,17 +96,12 @@ class QiskitBackend:
             shots = config.get('shots', 100)
             backend_name = config.get('backend', 'simulator')
 
-            # Build example circuit
-            circuit = QuantumCircuit(1, 1)
-            if circuit_type == 'simple_x':
-                circuit.x(0)
-                circuit.measure(0, 0)
-            else:
-                raise ValueError(f"Unsupported circuit type: {circuit_type}")
+            # Clone the prebuilt template circuit
+            circuit = _get_template(circuit_type).copy()
 
             # Execute based on backend
             if backend_name == 'simulator':
-                result = self._run_simulator(circuit, shots)
+                result = self._run_simulator(circuit, shots, circuit_type)
             elif backend_name == 'cloud' and self.provider:
                 result = self._run_cloud(circuit, shots, config.get('backend_id', 'ibmq_qasm_simulator'))
             else:
@@ -61,19 +113,40 @@ class QiskitBackend:
             logger.error(f"Error executing circuit: {str(e)}")
             return None
     
-    def _run_simulator(self, circuit: QuantumCircuit, shots: int) -> Any:
-        """Run circuit on Qiskit's Aer simulator."""
+    async def execute_many_async(self, configs: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Execute several circuit configs concurrently.
+
+        Cloud jobs spend most of their wall time in provider round-trips, so
+        submissions run in worker threads via asyncio.gather and come back in
+        input order.
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self.execute_qiskit_circuit, config) for config in configs)
+        )
+
+    def _run_simulator(self, circuit: 'qiskit.QuantumCircuit', shots: int, circuit_type: str) -> Any:
+        """Run circuit on Qiskit's Aer simulator, caching the transpiled circuit per type."""
         try:
-            backend = Aer.get_backend('qasm_simulator')
-            job = execute(circuit, backend, shots=shots)
+            transpiled = self._transpiled_cache.get(circuit_type)
+            if transpiled is None:
+                from qiskit import transpile
+
+                transpiled = transpile(circuit, self._aer, optimization_level=1)
+                self._transpiled_cache[circuit_type] = transpiled
+            job = self._aer.run(transpiled, shots=shots)
             result = job.result()
             return result
         except Exception as e:
             logger.error(f"Simulator execution error: {str(e)}")
             raise
     
-    def _run_cloud(self, circuit: QuantumCircuit, shots: int, backend_id: str) -> Any:
+    def _run_cloud(self, circuit: 'qiskit.QuantumCircuit', shots: int, backend_id: str) -> Any:
         """Run circuit on IBM Quantum cloud QPU or simulator."""
+        # Resolved through the module attribute so test patches on
+        # qiskit_backend.execute apply
+        execute = getattr(sys.modules[__name__], 'execute')
+        from qiskit.providers.ibmq import IBMQError
+
         try:
             if not self.provider:
                 raise ValueError("IBM Quantum provider not initialized")
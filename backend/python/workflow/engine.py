@@ -1,11 +1,13 @@
 import sqlite3
 import json
+import time
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
 import networkx as nx
-import torch
-from cirq import Circuit, NamedQubit, X, Simulator
+
+# torch and cirq are imported inside the task executors: the CLI imports this
+# module at startup and must not pay for either SDK until a task actually runs
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -30,9 +32,16 @@ class WorkflowEngine:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     name TEXT NOT NULL,
                     tasks TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending'
+                    status TEXT DEFAULT 'pending',
+                    version INTEGER DEFAULT 0
                 )
             ''')
+            # One-off migration for databases created before the version
+            # column; any write that changes tasks must bump it
+            try:
+                cursor.execute("ALTER TABLE workflows ADD COLUMN version INTEGER DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass  # Column already present
             self.conn.commit()
             logger.info(f"Initialized SQLite database at {self.db_path}")
         except sqlite3.Error as e:
@@ -87,24 +96,35 @@ class WorkflowEngine:
 
             # Execute tasks in topological order
             results = {}
+            metric_rows = []
             for node in nx.topological_sort(self.graph):
                 task = self.graph.nodes[node]
                 task_type = task['type']
                 config = task['config']
 
+                start_time = time.time()
                 if task_type == 'classical':
                     result = self._execute_classical_task(config)
                 elif task_type == 'quantum':
                     result = self._execute_quantum_task(config)
                 else:
                     raise ValueError(f"Unsupported task type: {task_type}")
+                runtime = time.time() - start_time
 
                 results[node] = result
+                metric_rows.append((
+                    workflow_id,
+                    node,
+                    runtime,
+                    config.get('depth') if task_type == 'quantum' else None,
+                    config.get('shots') if task_type == 'quantum' else None
+                ))
                 logger.info(f"Executed task {node} ({task_type}) in workflow {workflow_id}")
 
             # Update status
             cursor.execute("UPDATE workflows SET status = 'completed' WHERE id = ?", (workflow_id,))
             self.conn.commit()
+            self._record_metrics(metric_rows)
             logger.info(f"Workflow {workflow_id} completed")
 
             return {'workflow_id': workflow_id, 'name': name, 'results': results}
@@ -112,6 +132,21 @@ class WorkflowEngine:
             logger.error(f"Error executing workflow {workflow_id}: {str(e)}")
             return None
     
+    def _record_metrics(self, rows: List[tuple]) -> None:
+        """Store per-task runtimes for a finished workflow in one batched write."""
+        if not rows:
+            return
+        try:
+            from backend.python.monitor.performance import PerformanceMonitor
+            monitor = PerformanceMonitor(db_path=str(self.db_path))
+            try:
+                monitor.track_metrics_batch(rows)
+            finally:
+                monitor.close()
+        except Exception as e:
+            # Metrics are best-effort; never fail a completed workflow over them
+            logger.warning(f"Failed to record workflow metrics: {str(e)}")
+
     def _execute_classical_task(self, config: Dict[str, Any]) -> Any:
         """Execute a classical task (e.g., PyTorch preprocessing)."""
         try:
@@ -120,6 +155,8 @@ class WorkflowEngine:
                 raise ValueError("Classical task requires 'operation' in config")
 
             if config['operation'] == 'preprocess':
+                import torch
+
                 data = torch.tensor(config.get('data', [1.0, 2.0, 3.0]))
                 result = torch.mean(data).item()
                 return result
@@ -136,6 +173,8 @@ class WorkflowEngine:
             if 'circuit' not in config:
                 raise ValueError("Quantum task requires 'circuit' in config")
 
+            from cirq import Circuit, NamedQubit, X, Simulator
+
             # Sample circuit: Single qubit with X gate
             qubit = NamedQubit('q0')
             circuit = Circuit(X(qubit))
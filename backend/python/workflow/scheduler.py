@@ -1,51 +1,209 @@
+import aiosqlite
+import asyncio
+import hashlib
+import heapq
+import queue
 import sqlite3
+import struct
+import threading
+from collections import OrderedDict, defaultdict, namedtuple
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 import logging
-import networkx as nx
+import numpy as np
 import pyo3_runtime  # PyO3 binding for Rust scheduler
 import json
 
+try:
+    import orjson
+
+    def _json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:  # Fall back to stdlib json when orjson is unavailable
+    def _json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, sort_keys=sort_keys)
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+
+    @njit(cache=True, boundscheck=False)
+    def _cost_kernel(type_codes, sizes, shots, depth, out):  # pragma: no cover - compiled
+        for i in range(type_codes.size):
+            if type_codes[i] == 0:
+                out[i] = sizes[i] * 0.1
+            elif type_codes[i] == 1:
+                out[i] = shots[i] * depth[i] * 0.001
+            else:
+                out[i] = 1.0
+except ImportError:  # Numba is optional; small workflows use the NumPy path anyway
+    _cost_kernel = None
+
+# Below this many tasks the NumPy scatter path wins; above it the single fused
+# Numba loop avoids the per-type temporaries and index arrays
+_NUMBA_THRESHOLD = 100_000
+
+# Stable SQL strings so sqlite3's per-connection statement cache reuses the
+# compiled plans instead of re-parsing on every call
+_INSERT_SCHED = "INSERT OR REPLACE INTO schedules (workflow_id, task_id, backend, priority, status) VALUES (?, ?, ?, ?, 'pending')"
+_UPDATE_STATUS = "UPDATE schedules SET status = 'completed' WHERE workflow_id = ? AND task_id = ?"
+_SELECT_SCHED_BY_WF = "SELECT task_id, backend, priority FROM schedules WHERE workflow_id = ? ORDER BY priority"
+_SELECT_STATUS_BY_WF = "SELECT task_id, backend, priority, status FROM schedules WHERE workflow_id = ?"
+_SELECT_WF_TASKS = "SELECT version, tasks FROM workflows WHERE id = ?"
+
+# Connections held per scheduler instance; WAL lets pooled readers run
+# alongside a writer
+_POOL_SIZE = 4
+
+# Latency ceiling handed to the Rust scheduler (10 minutes)
+_MAX_LATENCY = 600.0
+
+# Dashboard refreshes reschedule identical workflows; keep the last few Rust
+# scheduling results keyed by task fingerprint
+_SCHED_CACHE_SIZE = 32
+
+# Concurrency ceiling for async DAG execution; ready tasks beyond this wait
+# in the priority heap until a slot frees up
+_MAX_CONCURRENT_TASKS = 4
+
+# The Rust scheduler is stateless from Python's point of view, so one shared
+# instance serves every WorkflowScheduler; constructing a PyO3 class per
+# request repays its init cost for nothing
+_rust_scheduler = None
+_rust_scheduler_lock = threading.Lock()
+
+def _get_rust_scheduler() -> Any:
+    """Return the shared Rust scheduler, constructing it on first use."""
+    global _rust_scheduler
+    if _rust_scheduler is None:
+        with _rust_scheduler_lock:
+            if _rust_scheduler is None:
+                _rust_scheduler = pyo3_runtime.Scheduler()
+                logger.info("Initialized Rust scheduler via PyO3")
+    return _rust_scheduler
+
+# Flat view of a task dict, extracted once per task so the scheduling path
+# reads attributes instead of repeating dict.get probes
+TaskView = namedtuple('TaskView', 'type config backend data shots depth deps')
+
+def _task_view(task: Dict[str, Any]) -> TaskView:
+    """Unpack a task dict into a TaskView in a single pass."""
+    config = task.get('config') or {}
+    return TaskView(
+        task.get('type'),
+        config,
+        config.get('backend', 'local'),
+        config.get('data'),
+        config.get('shots', 100),
+        config.get('depth', 10),
+        task.get('deps', [])
+    )
+
+# Quantum executors resolved on first use and cached, so repeated task
+# execution skips import machinery and backend construction entirely
+_QBACKENDS: Dict[str, Any] = {}
+
+def _get_quantum_executor(backend: str) -> Any:
+    """Return a cached execute function for the given quantum backend."""
+    executor = _QBACKENDS.get(backend)
+    if executor is None:
+        if backend == 'cirq':
+            from quantum.cirq_backend import CirqBackend
+            executor = CirqBackend().execute_cirq_circuit
+        elif backend == 'qiskit':
+            from quantum.qiskit_backend import QiskitBackend
+            executor = QiskitBackend().execute_qiskit_circuit
+        elif backend == 'pennylane':
+            from quantum.pennylane_backend import PennyLaneBackend
+            executor = PennyLaneBackend().execute_pennylane_circuit
+        else:
+            raise ValueError(f"Unsupported quantum backend: {backend}")
+        _QBACKENDS[backend] = executor
+    return executor
+
 class WorkflowScheduler:
     """Schedules hybrid quantum-classical workflow tasks using a Rust-based scheduler."""
     
     def __init__(self, db_path: str = 'workflows.db'):
         self.db_path = Path(db_path)
-        self.graph = nx.DiGraph()
-        self.conn = None
+        self._pool: queue.Queue = queue.Queue(maxsize=_POOL_SIZE)
+        self._sched_cache: OrderedDict = OrderedDict()
+        self._wf_cache: Dict[int, tuple] = {}
         self._init_db()
         try:
-            # Initialize Rust scheduler (assumes PyO3 bindings are compiled)
-            self.rust_scheduler = pyo3_runtime.Scheduler()
-            logger.info("Initialized Rust scheduler via PyO3")
+            # Shared Rust scheduler (assumes PyO3 bindings are compiled)
+            self.rust_scheduler = _get_rust_scheduler()
         except Exception as e:
             logger.error(f"Failed to initialize Rust scheduler: {str(e)}")
             raise
-    
+
     def _init_db(self) -> None:
-        """Initialize SQLite database for storing task schedules."""
+        """Initialize SQLite database and the connection pool for task schedules."""
         try:
-            self.conn = sqlite3.connect(self.db_path)
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS schedules (
-                    workflow_id INTEGER,
-                    task_id INTEGER,
-                    backend TEXT,
-                    priority INTEGER,
-                    status TEXT DEFAULT 'pending',
-                    PRIMARY KEY (workflow_id, task_id)
-                )
-            ''')
-            self.conn.commit()
+            for i in range(_POOL_SIZE):
+                # isolation_level=None leaves transaction control to explicit BEGIN/COMMIT
+                conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+                conn.row_factory = sqlite3.Row
+                # WAL + synchronous=NORMAL halve commit fsyncs and let status reads run
+                # while a scheduling transaction is open; busy_timeout avoids SQLITE_BUSY
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')
+                conn.execute('PRAGMA busy_timeout=5000')
+                conn.execute('PRAGMA temp_store=MEMORY')
+                conn.execute('PRAGMA cache_size=-65536')
+                if i == 0:
+                    conn.execute('''
+                        CREATE TABLE IF NOT EXISTS schedules (
+                            workflow_id INTEGER,
+                            task_id INTEGER,
+                            backend TEXT,
+                            priority INTEGER,
+                            status TEXT DEFAULT 'pending',
+                            PRIMARY KEY (workflow_id, task_id)
+                        )
+                    ''')
+                    # Serves both the WHERE workflow_id filter and the ORDER BY priority in
+                    # execute_scheduled_tasks without a sort step
+                    conn.execute('CREATE INDEX IF NOT EXISTS idx_sched_wf_prio ON schedules(workflow_id, priority)')
+                    conn.commit()
+                self._pool.put(conn)
             logger.info(f"Initialized schedules table in {self.db_path}")
         except sqlite3.Error as e:
             logger.error(f"Failed to initialize schedules database: {str(e)}")
             raise
+
+    def _load_workflow_tasks(self, conn: sqlite3.Connection, workflow_id: int) -> List[Dict[str, Any]]:
+        """Return the workflow's parsed tasks, reusing the cached parse while the version matches."""
+        row = conn.execute(_SELECT_WF_TASKS, (workflow_id,)).fetchone()
+        if not row:
+            raise ValueError(f"Workflow {workflow_id} not found")
+        version = row[0]
+        cached = self._wf_cache.get(workflow_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        tasks = _json_loads(row[1])
+        self._wf_cache[workflow_id] = (version, tasks)
+        return tasks
+
+    @contextmanager
+    def _connection(self):
+        """Check a connection out of the pool and return it when done."""
+        conn = self._pool.get()
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
     
     def schedule_workflow(self, workflow_id: int, tasks: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
         """Schedule tasks for a workflow, prioritizing to minimize latency."""
@@ -54,46 +212,119 @@ class WorkflowScheduler:
             if not tasks:
                 raise ValueError("Tasks list cannot be empty")
 
-            # Load workflow DAG
-            self.graph.clear()
-            for i, task in enumerate(tasks):
-                self.graph.add_node(i, **task)
-                if i > 0:
-                    self.graph.add_edge(i-1, i)  # Linear dependency for simplicity
+            # Unpack every task once; the passes below read TaskView attributes
+            # instead of re-probing the dicts
+            views = [_task_view(task) for task in tasks]
+
+            # Estimate costs in bulk: one NumPy multiply per task type instead of
+            # a Python-level dispatch and arithmetic per task. Unknown types keep
+            # the same default cost the scalar _estimate_task_cost falls back to.
+            count = len(views)
+            try:
+                if _cost_kernel is not None and count >= _NUMBA_THRESHOLD:
+                    # Fused compiled loop for very large workflows: task type encoded
+                    # as int8 (0 classical, 1 quantum, 2 other) in a single pass
+                    type_codes = np.fromiter(
+                        (0 if tv.type == 'classical' else 1 if tv.type == 'quantum' else 2 for tv in views),
+                        dtype=np.int8, count=count
+                    )
+                    sizes = np.fromiter((len(tv.data) if tv.data else 0 for tv in views), dtype=np.int64, count=count)
+                    shots = np.fromiter((tv.shots for tv in views), dtype=np.int64, count=count)
+                    depth = np.fromiter((tv.depth for tv in views), dtype=np.int64, count=count)
+                    costs = np.empty(count, dtype=np.float64)
+                    _cost_kernel(type_codes, sizes, shots, depth, costs)
+                else:
+                    classical_idx = [i for i, tv in enumerate(views) if tv.type == 'classical']
+                    quantum_idx = [i for i, tv in enumerate(views) if tv.type == 'quantum']
+                    costs = np.full(count, 1.0, dtype=np.float64)
+                    if classical_idx:
+                        sizes = np.fromiter(
+                            (len(views[i].data or []) for i in classical_idx),
+                            dtype=np.int64, count=len(classical_idx)
+                        )
+                        costs[classical_idx] = sizes * 0.1
+                    if quantum_idx:
+                        shots = np.fromiter(
+                            (views[i].shots for i in quantum_idx),
+                            dtype=np.int64, count=len(quantum_idx)
+                        )
+                        depth = np.fromiter(
+                            (views[i].depth for i in quantum_idx),
+                            dtype=np.int64, count=len(quantum_idx)
+                        )
+                        costs[quantum_idx] = shots * depth * 0.001
+            except (TypeError, ValueError):
+                # Malformed per-task fields (shots=None, unsized data, ...) break
+                # the bulk arrays; fall back to the scalar estimator, which
+                # defaults such tasks to cost 1.0 instead of failing the schedule
+                costs = np.fromiter(
+                    (self._estimate_task_cost(tv.type, tv.config) for tv in views),
+                    dtype=np.float64, count=count
+                )
 
             # Prepare tasks for Rust scheduler
-            task_configs = []
-            for i, task in enumerate(tasks):
-                task_type = task.get('type')
-                config = task.get('config', {})
-                backend = config.get('backend', 'local')
-                estimated_cost = self._estimate_task_cost(task_type, config)
-                task_configs.append({
+            task_configs = [
+                {
                     'id': i,
-                    'type': task_type,
-                    'backend': backend,
-                    'estimated_cost': estimated_cost
-                })
+                    'type': tv.type,
+                    'backend': tv.backend,
+                    'estimated_cost': float(costs[i]),
+                    # Explicit parent indices; tasks without deps are free to
+                    # run as soon as the scheduler dispatches them
+                    'deps': tv.deps
+                }
+                for i, tv in enumerate(views)
+            ]
 
-            # Call Rust scheduler to prioritize tasks
-            try:
-                prioritized_tasks = self.rust_scheduler.schedule_tasks(
-                    json.dumps(task_configs),  # Serialize to JSON for Rust
-                    max_latency=600.0  # Max 10 minutes in seconds
-                )
-                prioritized_tasks = json.loads(prioritized_tasks)  # Deserialize Rust output
-            except Exception as e:
-                logger.error(f"Rust scheduler error: {str(e)}")
-                return None
-
-            # Save schedule to database
-            cursor = self.conn.cursor()
-            for task in prioritized_tasks:
-                cursor.execute(
-                    "INSERT OR REPLACE INTO schedules (workflow_id, task_id, backend, priority, status) VALUES (?, ?, ?, ?, 'pending')",
-                    (workflow_id, task['id'], task['backend'], task['priority'])
-                )
-            self.conn.commit()
+            # Identical task sets come back frequently (dashboard refreshes), so
+            # fingerprint the configs and reuse the previous scheduling result;
+            # the DB write below still runs since workflow_id may differ
+            cache_key = hashlib.blake2b(
+                _json_dumps(task_configs, sort_keys=True).encode() + struct.pack('<d', _MAX_LATENCY),
+                digest_size=16
+            ).digest()
+            # Cached entries are copied on the way out: callers mutate the
+            # returned dicts, and a shared reference would corrupt the memo
+            cached_tasks = self._sched_cache.get(cache_key)
+            if cached_tasks is not None:
+                self._sched_cache.move_to_end(cache_key)
+                prioritized_tasks = [dict(task) for task in cached_tasks]
+            else:
+                # Call Rust scheduler to prioritize tasks; the native PyO3 entry
+                # point takes the list of dicts directly, avoiding a
+                # serialize/parse pass on each side of the FFI boundary
+                try:
+                    if hasattr(self.rust_scheduler, 'schedule_tasks_native'):
+                        prioritized_tasks = self.rust_scheduler.schedule_tasks_native(
+                            task_configs,
+                            max_latency=_MAX_LATENCY
+                        )
+                    else:
+                        prioritized_tasks = self.rust_scheduler.schedule_tasks(
+                            _json_dumps(task_configs),  # Serialize to JSON for Rust
+                            max_latency=_MAX_LATENCY
+                        )
+                        prioritized_tasks = _json_loads(prioritized_tasks)  # Deserialize Rust output
+                except Exception as e:
+                    logger.error(f"Rust scheduler error: {str(e)}")
+                    return None
+                self._sched_cache[cache_key] = [dict(task) for task in prioritized_tasks]
+                if len(self._sched_cache) > _SCHED_CACHE_SIZE:
+                    self._sched_cache.popitem(last=False)
+
+            # Save schedule in one transaction: a single prepared statement and one
+            # fsync instead of a round trip per task
+            with self._connection() as conn:
+                try:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(
+                        _INSERT_SCHED,
+                        [(workflow_id, task['id'], task['backend'], task['priority']) for task in prioritized_tasks]
+                    )
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
             logger.info(f"Scheduled {len(tasks)} tasks for workflow {workflow_id}")
 
             return prioritized_tasks
@@ -102,7 +333,7 @@ class WorkflowScheduler:
             return None
     
     def _estimate_task_cost(self, task_type: str, config: Dict[str, Any]) -> float:
-        """Estimate the computational cost of a task for scheduling."""
+        """Estimate the computational cost of a single task (scalar reference for the vectorized path)."""
         try:
             if task_type == 'classical':
                 # Example: Cost based on data size
@@ -122,43 +353,141 @@ class WorkflowScheduler:
     def execute_scheduled_tasks(self, workflow_id: int) -> Optional[Dict[str, Any]]:
         """Execute scheduled tasks for a workflow."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT task_id, backend, priority FROM schedules WHERE workflow_id = ? ORDER BY priority", (workflow_id,))
-            scheduled_tasks = cursor.fetchall()
-            if not scheduled_tasks:
-                raise ValueError(f"No scheduled tasks found for workflow {workflow_id}")
+            with self._connection() as conn:
+                scheduled_tasks = conn.execute(_SELECT_SCHED_BY_WF, (workflow_id,)).fetchall()
+                if not scheduled_tasks:
+                    raise ValueError(f"No scheduled tasks found for workflow {workflow_id}")
+
+                # Fetch the workflow's tasks once; repeat executions reuse the
+                # cached parse as long as the stored version is unchanged
+                tasks = self._load_workflow_tasks(conn, workflow_id)
 
             results = {}
-            for task_id, backend, _ in scheduled_tasks:
-                # Fetch task details from workflow
-                cursor.execute("SELECT tasks FROM workflows WHERE id = ?", (workflow_id,))
-                tasks_json = cursor.fetchone()
-                if not tasks_json:
-                    raise ValueError(f"Workflow {workflow_id} not found")
-                
-                tasks = json.loads(tasks_json[0])
+            completed = []
+            try:
+                for task_id, backend, _ in scheduled_tasks:
+                    task = tasks[task_id]
+                    task_type = task['type']
+                    config = task['config']
+
+                    # Execute task based on type and backend
+                    if task_type == 'classical':
+                        result = self._execute_classical_task(config)
+                    elif task_type == 'quantum':
+                        result = self._execute_quantum_task(config, backend)
+                    else:
+                        raise ValueError(f"Unsupported task type: {task_type}")
+
+                    results[task_id] = result
+                    completed.append((workflow_id, task_id))
+                    logger.info(f"Executed task {task_id} for workflow {workflow_id}")
+            finally:
+                # Mark completed tasks in one batched write instead of a commit
+                # per task; runs in a finally so progress made before a failing
+                # task is still persisted
+                if completed:
+                    with self._connection() as conn:
+                        try:
+                            conn.execute("BEGIN IMMEDIATE")
+                            conn.executemany(_UPDATE_STATUS, completed)
+                            conn.commit()
+                        except sqlite3.Error:
+                            conn.rollback()
+                            raise
+
+            return {'workflow_id': workflow_id, 'results': results}
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error executing scheduled tasks for workflow {workflow_id}: {str(e)}")
+            return None
+    
+    async def execute_scheduled_tasks_async(self, workflow_id: int) -> Optional[Dict[str, Any]]:
+        """Execute scheduled tasks concurrently across independent DAG branches."""
+        try:
+            with self._connection() as conn:
+                scheduled_tasks = conn.execute(_SELECT_SCHED_BY_WF, (workflow_id,)).fetchall()
+                if not scheduled_tasks:
+                    raise ValueError(f"No scheduled tasks found for workflow {workflow_id}")
+                tasks = self._load_workflow_tasks(conn, workflow_id)
+
+            # Dependency counters and child adjacency from the caller-declared
+            # deps; a task is released the moment its last parent finishes
+            # rather than when a whole level drains
+            backends = {row[0]: row[1] for row in scheduled_tasks}
+            priorities = {row[0]: row[2] for row in scheduled_tasks}
+            dep_count: Dict[int, int] = {}
+            children: Dict[int, List[int]] = defaultdict(list)
+            for task_id in backends:
+                deps = tasks[task_id].get('deps', [])
+                dep_count[task_id] = len(deps)
+                for dep in deps:
+                    children[dep].append(task_id)
+
+            async def _run(task_id: int) -> Any:
                 task = tasks[task_id]
-                task_type = task['type']
                 config = task['config']
+                # The backend SDKs are synchronous; a thread keeps their
+                # network waits off the event loop
+                if task['type'] == 'classical':
+                    return await asyncio.to_thread(self._execute_classical_task, config)
+                elif task['type'] == 'quantum':
+                    return await asyncio.to_thread(self._execute_quantum_task, config, backends[task_id])
+                raise ValueError(f"Unsupported task type: {task['type']}")
 
-                # Execute task based on type and backend
-                if task_type == 'classical':
-                    result = self._execute_classical_task(config)
-                elif task_type == 'quantum':
-                    result = self._execute_quantum_task(config, backend)
-                else:
-                    raise ValueError(f"Unsupported task type: {task_type}")
+            results: Dict[int, Any] = {}
+            completed: List[tuple] = []
+            error: Optional[Exception] = None
+            running = set()
+            task_ids = {}
+            # Ready tasks wait in a heap keyed by scheduler priority (lower
+            # rank = more critical), so freeing a slot dispatches the best
+            # candidate in O(log n) instead of a linear scan
+            ready: List[tuple] = []
+            for task_id in backends:
+                if dep_count[task_id] == 0:
+                    heapq.heappush(ready, (priorities[task_id], task_id))
+
+            def _dispatch() -> None:
+                while ready and len(running) < _MAX_CONCURRENT_TASKS:
+                    _, task_id = heapq.heappop(ready)
+                    fut = asyncio.ensure_future(_run(task_id))
+                    task_ids[fut] = task_id
+                    running.add(fut)
 
-                results[task_id] = result
-                cursor.execute("UPDATE schedules SET status = 'completed' WHERE workflow_id = ? AND task_id = ?", (workflow_id, task_id))
-                self.conn.commit()
-                logger.info(f"Executed task {task_id} for workflow {workflow_id}")
+            _dispatch()
+            try:
+                while running:
+                    done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                    for fut in done:
+                        task_id = task_ids.pop(fut)
+                        exc = fut.exception()
+                        if exc is not None:
+                            error = exc
+                            continue
+                        results[task_id] = fut.result()
+                        completed.append((workflow_id, task_id))
+                        logger.info(f"Executed task {task_id} for workflow {workflow_id}")
+                        for child in children[task_id]:
+                            dep_count[child] -= 1
+                            if dep_count[child] == 0:
+                                heapq.heappush(ready, (priorities[child], child))
+                    if error is None:
+                        _dispatch()
+            finally:
+                # Persist whatever finished in one batched write, matching the
+                # sync path's crash semantics
+                if completed:
+                    async with aiosqlite.connect(self.db_path) as db:
+                        await db.execute('PRAGMA busy_timeout=5000')
+                        await db.executemany(_UPDATE_STATUS, completed)
+                        await db.commit()
 
+            if error is not None:
+                raise error
             return {'workflow_id': workflow_id, 'results': results}
         except (sqlite3.Error, ValueError) as e:
             logger.error(f"Error executing scheduled tasks for workflow {workflow_id}: {str(e)}")
             return None
-    
+
     def _execute_classical_task(self, config: Dict[str, Any]) -> Any:
         """Execute a classical task (placeholder for PyTorch preprocessing)."""
         try:
@@ -166,8 +495,10 @@ class WorkflowScheduler:
                 raise ValueError("Classical task requires 'operation' in config")
 
             if config['operation'] == 'preprocess':
-                data = torch.tensor(config.get('data', [1.0, 2.0, 3.0]))
-                return torch.mean(data).item()
+                # A scalar reduction needs no tensor: np.asarray takes lists or
+                # NumPy arrays without an extra copy and mean runs in C
+                data = np.asarray(config.get('data', [1.0, 2.0, 3.0]), dtype=np.float32)
+                return float(data.mean())
             else:
                 raise ValueError(f"Unsupported classical operation: {config['operation']}")
         except Exception as e:
@@ -177,18 +508,8 @@ class WorkflowScheduler:
     def _execute_quantum_task(self, config: Dict[str, Any], backend: str) -> Any:
         """Execute a quantum task using specified backend."""
         try:
-            # Placeholder: Route to appropriate quantum backend
-            if backend == 'cirq':
-                from quantum.cirq_backend import execute_cirq_circuit
-                return execute_cirq_circuit(config)
-            elif backend == 'qiskit':
-                from quantum.qiskit_backend import execute_qiskit_circuit
-                return execute_qiskit_circuit(config)
-            elif backend == 'pennylane':
-                from quantum.pennylane_backend import execute_pennylane_circuit
-                return execute_pennylane_circuit(config)
-            else:
-                raise ValueError(f"Unsupported quantum backend: {backend}")
+            # Route through the cached per-backend executor
+            return _get_quantum_executor(backend)(config)
         except Exception as e:
             logger.error(f"Error in quantum task: {str(e)}")
             raise
@@ -196,9 +517,11 @@ class WorkflowScheduler:
     def get_schedule_status(self, workflow_id: int) -> Optional[List[Dict[str, Any]]]:
         """Retrieve the status of scheduled tasks for a workflow."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT task_id, backend, priority, status FROM schedules WHERE workflow_id = ?", (workflow_id,))
-            schedules = [{'task_id': row[0], 'backend': row[1], 'priority': row[2], 'status': row[3]} for row in cursor.fetchall()]
+            with self._connection() as conn:
+                # Build the result straight off the cursor iterator; fetchall
+                # would materialize a second, transient list of tuples first
+                cursor = conn.execute(_SELECT_STATUS_BY_WF, (workflow_id,))
+                schedules = [dict(row) for row in cursor]
             if not schedules:
                 raise ValueError(f"No schedule found for workflow {workflow_id}")
             return schedules
@@ -207,11 +530,14 @@ class WorkflowScheduler:
             return None
     
     def close(self) -> None:
-        """Close the database connection."""
+        """Close all pooled database connections."""
         try:
-            if self.conn:
-                self.conn.close()
-                logger.info("Closed database connection")
+            while True:
+                try:
+                    self._pool.get_nowait().close()
+                except queue.Empty:
+                    break
+            logger.info("Closed database connection")
         except sqlite3.Error as e:
             logger.error(f"Error closing database connection: {str(e)}")
 
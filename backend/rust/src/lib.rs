@@ -1,6 +1,7 @@
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
 use serde::{Deserialize, Serialize};
-use std::collections::BinaryHeap;
+use std::collections::{BinaryHeap, VecDeque};
 use std::cmp::Ordering;
 use std::sync::Arc;
 use tokio::sync::Mutex;
@@ -14,10 +15,13 @@ struct TaskConfig {
     estimated_cost: f64,
 }
 
-// Priority queue item for task scheduling
+// Priority queue item for task scheduling; pos is the task's position in the
+// input list, which the graph arrays are indexed by (ids are caller-assigned
+// labels and are only echoed back in the output)
 #[derive(Clone)]
 struct TaskPriority {
     task: TaskConfig,
+    pos: usize,
     priority: f64, // Lower priority value means higher priority
 }
 
@@ -95,6 +99,7 @@ impl Scheduler {
                     ));
                 }
                 heap.push(TaskPriority {
+                    pos: task.id,
                     task: task.clone(),
                     priority: task.estimated_cost, // Lower cost = higher priority
                 });
@@ -115,6 +120,156 @@ impl Scheduler {
         })
     }
 
+    /// Schedule tasks passed as native Python dicts, skipping the JSON round-trip.
+    /// Tasks may carry a 'deps' list of parent indices; priorities are assigned
+    /// as topL(v) + bottomL(v) (longest path through v) so critical-path tasks
+    /// are dispatched first, and the output respects the dependency order.
+    /// Args:
+    ///     task_configs: List of task dicts with id, type, backend, estimated_cost
+    ///         and optional deps
+    ///     max_latency: Maximum allowed latency in seconds
+    ///     max_budget: Maximum allowed cost in USD (unbounded by default)
+    /// Returns:
+    ///     List of prioritized task dicts
+    #[pyo3(signature = (task_configs, max_latency, max_budget = f64::INFINITY))]
+    fn schedule_tasks_native(
+        &self,
+        py: Python,
+        task_configs: &PyList,
+        max_latency: f64,
+        max_budget: f64,
+    ) -> PyResult<Py<PyList>> {
+        let n = task_configs.len();
+        let mut tasks: Vec<TaskConfig> = Vec::with_capacity(n);
+        let mut parents: Vec<Vec<usize>> = Vec::with_capacity(n);
+        let mut total_cost = 0.0;
+
+        for item in task_configs.iter() {
+            let task = TaskConfig {
+                id: item.get_item("id")?.extract()?,
+                r#type: item.get_item("type")?.extract()?,
+                backend: item.get_item("backend")?.extract()?,
+                estimated_cost: item.get_item("estimated_cost")?.extract()?,
+            };
+
+            // Simplified latency estimation
+            let latency = task.estimated_cost * 10.0; // Arbitrary scaling
+            if latency > max_latency {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    format!("Task {} exceeds max latency: {}s > {}s", task.id, latency, max_latency),
+                ));
+            }
+            total_cost += task.estimated_cost;
+            if total_cost > max_budget {
+                return Err(pyo3::exceptions::PyValueError::new_err(
+                    format!("Total cost exceeds budget: ${} > ${}", total_cost, max_budget),
+                ));
+            }
+
+            // Dependencies are optional; absent or empty means the task is ready
+            let deps: Vec<usize> = match item.get_item("deps") {
+                Ok(value) => value.extract()?,
+                Err(_) => Vec::new(),
+            };
+            for &dep in &deps {
+                if dep >= n {
+                    return Err(pyo3::exceptions::PyValueError::new_err(
+                        format!("Task {} depends on unknown task {}", task.id, dep),
+                    ));
+                }
+            }
+            tasks.push(task);
+            parents.push(deps);
+        }
+
+        // Build adjacency and in-degrees for Kahn's topological sort
+        let costs: Vec<f64> = tasks.iter().map(|t| t.estimated_cost).collect();
+        let mut children: Vec<Vec<usize>> = vec![Vec::new(); n];
+        let mut indegree = vec![0usize; n];
+        for (v, deps) in parents.iter().enumerate() {
+            for &u in deps {
+                children[u].push(v);
+                indegree[v] += 1;
+            }
+        }
+        let mut queue: VecDeque<usize> =
+            (0..n).filter(|&v| indegree[v] == 0).collect();
+        let mut pending = indegree.clone();
+        let mut topo = Vec::with_capacity(n);
+        while let Some(v) = queue.pop_front() {
+            topo.push(v);
+            for &w in &children[v] {
+                pending[w] -= 1;
+                if pending[w] == 0 {
+                    queue.push_back(w);
+                }
+            }
+        }
+        if topo.len() != n {
+            return Err(pyo3::exceptions::PyValueError::new_err(
+                "Task dependencies contain a cycle",
+            ));
+        }
+
+        // Two longest-path passes: topL from entries, bottomL to exits;
+        // topL + bottomL is the length of the longest path through each task
+        let mut top_l = vec![0.0f64; n];
+        for &v in &topo {
+            for &w in &children[v] {
+                top_l[w] = top_l[w].max(top_l[v] + costs[v]);
+            }
+        }
+        let mut bottom_l = costs.clone();
+        for &v in topo.iter().rev() {
+            for &w in &children[v] {
+                bottom_l[v] = bottom_l[v].max(costs[v] + bottom_l[w]);
+            }
+        }
+
+        // List scheduling: among ready tasks always dispatch the one on the
+        // longest remaining path. Priorities are negated because TaskPriority's
+        // heap pops the smallest value first.
+        let mut heap = BinaryHeap::new();
+        let mut ready = indegree;
+        for v in 0..n {
+            if ready[v] == 0 {
+                heap.push(TaskPriority {
+                    priority: -(top_l[v] + bottom_l[v]),
+                    pos: v,
+                    task: tasks[v].clone(),
+                });
+            }
+        }
+
+        // Emit prioritized tasks as Python dicts; priority is the execution
+        // rank in dispatch order, which Python persists alongside the task
+        let mut rank = 0usize;
+        let result = PyList::empty(py);
+        while let Some(task_priority) = heap.pop() {
+            let v = task_priority.pos;
+            let dict = PyDict::new(py);
+            dict.set_item("id", task_priority.task.id)?;
+            dict.set_item("type", task_priority.task.r#type)?;
+            dict.set_item("backend", task_priority.task.backend)?;
+            dict.set_item("estimated_cost", task_priority.task.estimated_cost)?;
+            dict.set_item("priority", rank)?;
+            result.append(dict)?;
+            rank += 1;
+            for &w in &children[v] {
+                ready[w] -= 1;
+                if ready[w] == 0 {
+                    heap.push(TaskPriority {
+                        priority: -(top_l[w] + bottom_l[w]),
+                        pos: w,
+                        task: tasks[w].clone(),
+                    });
+                }
+            }
+        }
+
+        Ok(result.into())
+    }
+
     /// Execute tasks concurrently (placeholder for async execution)
     fn execute_tasks(&self, task_configs_json: String) -> PyResult<String> {
         Python::with_gil(|_py| {
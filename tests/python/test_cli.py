@@ -0,0 +1,26 @@
+import pytest
+from unittest.mock import patch
+from click.testing import CliRunner
+
+from backend.python import cli
+
+
+def test_run_workflow_serializes_int_task_ids():
+    # execute_workflow keys results by int task id; the CLI must serialize
+    # them (orjson rejects non-string dict keys unless told otherwise)
+    runner = CliRunner()
+    with patch("backend.python.cli.WorkflowEngine") as mock_engine:
+        instance = mock_engine.return_value
+        instance.execute_workflow.return_value = {
+            "workflow_id": 1,
+            "name": "Test Workflow",
+            "results": {0: 2.0, 1: {"0": 50, "1": 50}},
+        }
+
+        result = runner.invoke(cli.cli, ["run-workflow", "--id", "1"])
+
+    assert result.exit_code == 0
+    assert "Error" not in result.output
+    assert "Workflow 1 executed successfully" in result.output
+    assert '"workflow_id"' in result.output
+    instance.close.assert_called_once()
@@ -3,7 +3,7 @@ import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 from fastapi.testclient import TestClient
-from backend.python.monitor.performance import PerformanceMonitor, app
+from backend.python.monitor.performance import PerformanceMonitor, app, get_monitor
 from backend.python.monitor.cost_estimator import CostEstimator
 
 # Fixture to set up and tear down SQLite database
@@ -21,10 +21,13 @@ def performance_monitor(db_path):
     yield monitor
     monitor.close()
 
-# Fixture to initialize TestClient for FastAPI
+# Fixture to initialize TestClient for FastAPI, routing the get_monitor
+# dependency to the tmp-path monitor instead of the process-wide singleton
 @pytest.fixture
-def client():
-    return TestClient(app)
+def client(performance_monitor):
+    app.dependency_overrides[get_monitor] = lambda: performance_monitor
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_monitor, None)
 
 # Test PerformanceMonitor
 def test_track_metrics_success(performance_monitor):
@@ -36,7 +39,8 @@ def test_track_metrics_success(performance_monitor):
     task_id = 0
     
     performance_monitor.track_metrics(workflow_id, task_id, task_config)
-    
+    performance_monitor.flush()
+
     # Verify database entry
     conn = sqlite3.connect(performance_monitor.db_path)
     cursor = conn.cursor()
@@ -175,13 +179,15 @@ def test_optimize_schedule_success(mock_scheduler):
     tasks = [
         {"type": "quantum", "config": {"circuit": "simple_x", "shots": 100, "depth": 5, "backend": "cirq", "backend_type": "simulator"}}
     ]
+    # optimize_schedule prefers the native entry point when present, so the
+    # mock must cover it rather than the legacy JSON schedule_tasks
     mock_scheduler_instance = mock_scheduler.return_value
-    mock_scheduler_instance.rust_scheduler.schedule_tasks.return_value = json.dumps([
-        {"id": 0, "type": "quantum", "backend": "cirq", "estimated_cost": 0.015}
-    ])
-    
+    mock_scheduler_instance.rust_scheduler.schedule_tasks_native.return_value = [
+        {"id": 0, "type": "quantum", "backend": "cirq", "estimated_cost": 0.015, "priority": 0}
+    ]
+
     result = estimator.optimize_schedule(tasks, max_budget=1.0)
-    
+
     assert result is not None
     assert len(result) == 1
     assert result[0]["id"] == 0
@@ -193,7 +199,7 @@ def test_optimize_schedule_failure(mock_scheduler):
         {"type": "quantum", "config": {"circuit": "simple_x", "shots": 100, "depth": 5, "backend": "cirq", "backend_type": "simulator"}}
     ]
     mock_scheduler_instance = mock_scheduler.return_value
-    mock_scheduler_instance.rust_scheduler.schedule_tasks.side_effect = Exception("Rust scheduler error")
+    mock_scheduler_instance.rust_scheduler.schedule_tasks_native.side_effect = Exception("Rust scheduler error")
     
     result = estimator.optimize_schedule(tasks, max_budget=1.0)
     
@@ -0,0 +1,65 @@
+import pytest
+
+# These tests exercise the compiled PyO3 scheduler directly; skip when the
+# extension module has not been built
+pyo3_runtime = pytest.importorskip("pyo3_runtime")
+
+
+@pytest.fixture
+def rust_scheduler():
+    return pyo3_runtime.Scheduler()
+
+
+def _task(task_id, cost=0.5, deps=None):
+    return {
+        "id": task_id,
+        "type": "quantum",
+        "backend": "cirq",
+        "estimated_cost": cost,
+        "deps": deps or [],
+    }
+
+
+def test_schedule_tasks_native_rejects_cycle(rust_scheduler):
+    tasks = [_task(0, deps=[1]), _task(1, deps=[0])]
+    with pytest.raises(ValueError, match="cycle"):
+        rust_scheduler.schedule_tasks_native(tasks, max_latency=600.0)
+
+
+def test_schedule_tasks_native_respects_dependencies(rust_scheduler):
+    # Diamond: 0 -> {1, 2} -> 3
+    tasks = [
+        _task(0),
+        _task(1, deps=[0]),
+        _task(2, deps=[0]),
+        _task(3, deps=[1, 2]),
+    ]
+    schedule = rust_scheduler.schedule_tasks_native(tasks, max_latency=600.0)
+
+    order = [task["id"] for task in schedule]
+    assert sorted(order) == [0, 1, 2, 3]
+    for task in tasks:
+        for dep in task["deps"]:
+            assert order.index(dep) < order.index(task["id"])
+
+
+def test_schedule_tasks_native_assigns_priority_ranks(rust_scheduler):
+    tasks = [_task(0), _task(1, deps=[0]), _task(2)]
+    schedule = rust_scheduler.schedule_tasks_native(tasks, max_latency=600.0)
+
+    # Priority is the dispatch rank: sequential from zero in output order
+    assert [task["priority"] for task in schedule] == [0, 1, 2]
+
+
+def test_schedule_tasks_native_prefers_critical_path(rust_scheduler):
+    # The chain 0 -> 1 is the longest remaining path, so its root must be
+    # dispatched before the cheap independent task
+    tasks = [
+        _task(0, cost=2.0),
+        _task(1, cost=2.0, deps=[0]),
+        _task(2, cost=0.1),
+    ]
+    schedule = rust_scheduler.schedule_tasks_native(tasks, max_latency=600.0)
+
+    order = [task["id"] for task in schedule]
+    assert order.index(0) < order.index(2)
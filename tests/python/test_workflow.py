@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import sqlite3
 import json
@@ -153,3 +154,49 @@ def test_get_schedule_status(scheduler):
 def test_get_schedule_status_not_found(scheduler):
     status = scheduler.get_schedule_status(999)
     assert status is None
+
+# Test concurrent DAG execution
+def test_execute_scheduled_tasks_async_diamond(scheduler, mock_quantum_backend):
+    # Diamond DAG: 0 -> {1, 2} -> 3
+    tasks = [
+        {"type": "classical", "config": {"operation": "preprocess", "data": [1.0, 2.0], "backend": "local"}},
+        {"type": "quantum", "config": {"circuit": "simple_x", "shots": 100, "backend": "cirq"}, "deps": [0]},
+        {"type": "classical", "config": {"operation": "preprocess", "data": [3.0, 4.0], "backend": "local"}, "deps": [0]},
+        {"type": "classical", "config": {"operation": "preprocess", "data": [5.0, 6.0], "backend": "local"}, "deps": [1, 2]},
+    ]
+    engine = WorkflowEngine(db_path=scheduler.db_path)
+    workflow_id = engine.define_workflow("Diamond Workflow", tasks)
+    engine.close()
+    scheduler.schedule_workflow(workflow_id, tasks)
+
+    result = asyncio.run(scheduler.execute_scheduled_tasks_async(workflow_id))
+
+    assert result is not None
+    assert result["workflow_id"] == workflow_id
+    assert len(result["results"]) == 4
+    assert result["results"][1] == {"0": 50, "1": 50}  # Mocked quantum result
+    status = scheduler.get_schedule_status(workflow_id)
+    assert all(row["status"] == "completed" for row in status)
+
+def test_execute_scheduled_tasks_async_failure_persists_completed(scheduler):
+    tasks = [
+        {"type": "classical", "config": {"operation": "preprocess", "data": [1.0, 2.0], "backend": "local"}},
+        {"type": "quantum", "config": {"circuit": "simple_x", "shots": 100, "backend": "cirq"}, "deps": [0]},
+    ]
+    engine = WorkflowEngine(db_path=scheduler.db_path)
+    workflow_id = engine.define_workflow("Failing Workflow", tasks)
+    engine.close()
+    scheduler.schedule_workflow(workflow_id, tasks)
+
+    with patch(
+        "backend.python.workflow.scheduler.WorkflowScheduler._execute_quantum_task",
+        side_effect=ValueError("backend exploded"),
+    ):
+        result = asyncio.run(scheduler.execute_scheduled_tasks_async(workflow_id))
+
+    # The failed run reports no result, but tasks that finished before the
+    # failure keep their completed status
+    assert result is None
+    status = {row["task_id"]: row["status"] for row in scheduler.get_schedule_status(workflow_id)}
+    assert status[0] == "completed"
+    assert status[1] == "pending"